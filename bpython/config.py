@@ -203,6 +203,7 @@ class Config:
         "curtsies": {
             "list_above": False,
             "right_arrow_completion": True,
+            "synchronized_updates": True,
         },
     }
 
@@ -331,6 +332,9 @@ class Config:
         self.curtsies_right_arrow_completion = config.getboolean(
             "curtsies", "right_arrow_completion"
         )
+        self.curtsies_synchronized_updates = config.getboolean(
+            "curtsies", "synchronized_updates"
+        )
         self.unicode_box = config.getboolean("general", "unicode_box")
 
         self.color_scheme = dict()
@@ -3,14 +3,18 @@
 # mypy: disallow_untyped_calls=True
 
 import argparse
-import collections
+import contextlib
 import logging
 import sys
+import termios
+import time
+from types import TracebackType
 
 import curtsies
 import curtsies.events
 import curtsies.input
 import curtsies.window
+from curtsies import FSArray, FmtStr
 
 from . import args as bpargs, translations, inspection
 from .config import Config
@@ -26,16 +30,25 @@ from typing import (
     Callable,
     Dict,
     Generator,
+    Iterator,
     List,
     Optional,
     Protocol,
     Sequence,
     Tuple,
+    Type,
     Union,
 )
 
 logger = logging.getLogger(__name__)
 
+# upper bound on repaints per second while draining a burst of events
+MAX_RENDER_RATE = 60
+
+# DEC private mode 2026: the terminal holds back output until the update ends
+BEGIN_SYNCHRONIZED_UPDATE = "\x1b[?2026h"
+END_SYNCHRONIZED_UPDATE = "\x1b[?2026l"
+
 
 class SupportsEventGeneration(Protocol):
     def send(
@@ -50,6 +63,81 @@ class SupportsEventGeneration(Protocol):
         ...
 
 
+class FrameBufferedWindow(curtsies.window.CursorAwareWindow):
+    """CursorAwareWindow that collects the output of render_to_terminal and
+    writes each frame to the terminal at once.
+
+    Anything that writes to the terminal outside of the frame, such as
+    scrolling, cursor position queries from a SIGWINCH handler or leaving the
+    window on suspend, first writes out the part of the frame rendered so far
+    and bypasses the buffer."""
+
+    def __init__(
+        self, *args: Any, synchronized_updates: bool = False, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.synchronized_updates = synchronized_updates
+        self._frame: Optional[List[str]] = None
+
+    def write(self, msg: str) -> None:
+        if self._frame is None:
+            super().write(msg)
+        else:
+            self._frame.append(msg)
+
+    def _write_frame(self, frame: List[str]) -> None:
+        if frame:
+            super().write("".join(frame))
+
+    @contextlib.contextmanager
+    def _unbuffered(self) -> Iterator[None]:
+        frame = self._frame
+        if frame is None:
+            yield
+            return
+        self._frame = None
+        self._write_frame(frame)
+        try:
+            yield
+        finally:
+            self._frame = []
+
+    def render_to_terminal(
+        self,
+        array: Union[FSArray, Sequence[FmtStr]],
+        cursor_pos: Tuple[int, int] = (0, 0),
+    ) -> int:
+        self._frame = []
+        if self.synchronized_updates:
+            self._frame.append(BEGIN_SYNCHRONIZED_UPDATE)
+        try:
+            return super().render_to_terminal(array, cursor_pos)
+        finally:
+            frame = self._frame
+            self._frame = None
+            if self.synchronized_updates:
+                frame.append(END_SYNCHRONIZED_UPDATE)
+            self._write_frame(frame)
+
+    def scroll_down(self) -> None:
+        # blessed writes to the stream directly while scrolling
+        with self._unbuffered():
+            super().scroll_down()
+
+    def get_cursor_position(self) -> Tuple[int, int]:
+        with self._unbuffered():
+            return super().get_cursor_position()
+
+    def __exit__(
+        self,
+        type: Optional[Type[BaseException]] = None,
+        value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        with self._unbuffered():
+            super().__exit__(type, value, traceback)
+
+
 class FullCurtsiesRepl(BaseRepl):
     def __init__(
         self,
@@ -61,12 +149,13 @@ class FullCurtsiesRepl(BaseRepl):
         self.input_generator = curtsies.input.Input(
             keynames="curtsies", sigint_event=True, paste_threshold=None
         )
-        window = curtsies.window.CursorAwareWindow(
+        window = FrameBufferedWindow(
             sys.stdout,
             sys.stdin,
             keep_last_line=True,
             hide_cursor=False,
             extra_bytes_callback=self.input_generator.unget_bytes,
+            synchronized_updates=config.curtsies_synchronized_updates,
         )
 
         self._request_refresh_callback: Callable[
@@ -87,8 +176,9 @@ class FullCurtsiesRepl(BaseRepl):
             events.UndoEvent
         )
 
-        with self.input_generator:
-            pass  # temp hack to get .original_stty
+        # the terminal attributes to restore when running external programs,
+        # as Input.__enter__ would read them
+        orig_tcattrs = termios.tcgetattr(self.input_generator.in_stream)
 
         super().__init__(
             config,
@@ -96,7 +186,7 @@ class FullCurtsiesRepl(BaseRepl):
             locals_=locals_,
             banner=banner,
             interp=interp,
-            orig_tcattrs=self.input_generator.original_stty,
+            orig_tcattrs=orig_tcattrs,
         )
 
     def _request_refresh(self) -> None:
@@ -132,10 +222,10 @@ class FullCurtsiesRepl(BaseRepl):
         self.window.__enter__()
         self.interrupting_refresh()
 
-    def process_event_and_paint(
-        self, e: Union[str, curtsies.events.Event, None]
-    ) -> None:
-        """If None is passed in, just paint the screen"""
+    def _apply_event(self, e: Union[str, curtsies.events.Event, None]) -> None:
+        """Update the repl state for an event without repainting
+
+        If None is passed in, do nothing."""
         try:
             if e is not None:
                 self.process_event(e)
@@ -144,13 +234,60 @@ class FullCurtsiesRepl(BaseRepl):
                 about_to_exit=True,
                 user_quit=isinstance(err, SystemExitFromCodeRunner),
             )
-            scrolled = self.window.render_to_terminal(array, cursor_pos)
-            self.scroll_offset += scrolled
+            self._render_to_terminal(array, cursor_pos)
             raise
-        else:
-            array, cursor_pos = self.paint()
-            scrolled = self.window.render_to_terminal(array, cursor_pos)
-            self.scroll_offset += scrolled
+
+    def _render(self) -> None:
+        """Paint the screen"""
+        array, cursor_pos = self.paint()
+        self._render_to_terminal(array, cursor_pos)
+
+    def _render_to_terminal(
+        self, array: FSArray, cursor_pos: Tuple[int, int]
+    ) -> None:
+        scrolled = self.window.render_to_terminal(array, cursor_pos)
+        self.scroll_offset += scrolled
+
+    def process_event_and_paint(
+        self, e: Union[str, curtsies.events.Event, None]
+    ) -> None:
+        """If None is passed in, just paint the screen"""
+        self._apply_event(e)
+        self._render()
+
+    def process_pending_events(
+        self,
+        e: Union[str, curtsies.events.Event, None],
+        inputs: SupportsEventGeneration,
+    ) -> None:
+        """Process e, then all immediately available events before painting
+        again.
+
+        The first event after being idle is painted right away. While
+        draining a burst of events (e.g. a paste), the screen is repainted
+        at most MAX_RENDER_RATE times per second. Pending changes are always
+        painted before resuming running code, which may block for a while."""
+        self.process_event_and_paint(e)
+        last_render = time.monotonic()
+        dirty = False
+        while (e := inputs.send(0)) is not None:
+            if (
+                dirty
+                and isinstance(e, events.RefreshRequestEvent)
+                and self.coderunner.code_is_waiting
+            ):
+                self._render()
+                last_render = time.monotonic()
+                dirty = False
+            self._apply_event(e)
+            dirty = True
+            now = time.monotonic()
+            if now - last_render > 1 / MAX_RENDER_RATE:
+                self._render()
+                last_render = now
+                dirty = False
+        if dirty:
+            self._render()
 
     def mainloop(
         self,
@@ -175,10 +312,10 @@ class FullCurtsiesRepl(BaseRepl):
         while self.module_gatherer.find_coroutine():
             e = inputs.send(0)
             if e is not None:
-                self.process_event_and_paint(e)
+                self.process_pending_events(e, inputs)
 
-        for e in inputs:
-            self.process_event_and_paint(e)
+        while True:
+            self.process_pending_events(inputs.send(None), inputs)
 
 
 def main(
@@ -256,29 +393,27 @@ def _combined_events(
 ) -> Generator[Union[str, curtsies.events.Event, None], Optional[float], None]:
     """Combines consecutive keypress events into paste events."""
     timeout = yield "nonsense_event"  # so send can be used immediately
-    queue: collections.deque = collections.deque()
     while True:
         e = event_provider.send(timeout)
-        if isinstance(e, curtsies.events.Event):
+        if e is None or isinstance(e, curtsies.events.Event):
             timeout = yield e
             continue
-        elif e is None:
-            timeout = yield None
-            continue
-        else:
-            queue.append(e)
+
+        keys = [e]
         e = event_provider.send(0)
         while not (e is None or isinstance(e, curtsies.events.Event)):
-            queue.append(e)
+            keys.append(e)
             e = event_provider.send(0)
-        if len(queue) >= paste_threshold:
+        if len(keys) >= paste_threshold:
             paste = curtsies.events.PasteEvent()
-            paste.events.extend(queue)
-            queue.clear()
+            paste.events.extend(keys)
             timeout = yield paste
         else:
-            while len(queue):
-                timeout = yield queue.popleft()
+            for key in keys:
+                timeout = yield key
+        # the event that ended the run of keys
+        if e is not None:
+            timeout = yield e
 
 
 def combined_events(
@@ -1,9 +1,13 @@
 import os
+import threading
 from collections import defaultdict
-from typing import Callable, Dict, Iterable, Sequence, Set, List
+from typing import Callable, Dict, Iterable, Optional, Sequence, Set, List
 
 from .. import importcompletion
 
+# seconds to wait for further file system events before reporting changes
+CHANGE_DEBOUNCE_DELAY = 0.05
+
 try:
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
@@ -21,32 +25,54 @@ else:
             on_change: Callable[[Sequence[str]], None],
         ) -> None:
             self.dirs: Dict[str, Set[str]] = defaultdict(set)
+            self._known_paths: Set[str] = set()
+            self._tracked_files: Set[str] = set()
+            self._scheduled_dirs: Set[str] = set()
             self.on_change = on_change
-            self.modules_to_add_later: List[str] = []
+            # changes are collected for a short while so that editors
+            # writing a file in several steps only trigger one reload
+            self._pending: List[str] = []
+            self._pending_lock = threading.Lock()
+            self._flush_timer: Optional[threading.Timer] = None
             self.observer = Observer()
             self.started = False
             self.activated = False
-            for path in paths:
-                self._add_module(path)
+            # directories are scheduled once activated
+            self.modules_to_add_later: List[str] = list(paths)
 
             super().__init__()
 
         def reset(self) -> None:
             self.dirs.clear()
+            self._known_paths.clear()
+            self._tracked_files.clear()
             self.modules_to_add_later.clear()
+            self._unschedule_all()
+            self._cancel_pending_changes()
+
+        def _schedule_dir(self, dirname: str) -> None:
+            if dirname not in self._scheduled_dirs:
+                self.observer.schedule(self, dirname, recursive=False)
+                self._scheduled_dirs.add(dirname)
+
+        def _unschedule_all(self) -> None:
             self.observer.unschedule_all()
+            self._scheduled_dirs.clear()
 
         def _add_module(self, path: str) -> None:
             """Add a python module to track changes"""
             path = os.path.abspath(path)
+            if path in self._known_paths:
+                return
+            self._known_paths.add(path)
             for suff in importcompletion.SUFFIXES:
                 if path.endswith(suff):
                     path = path[: -len(suff)]
                     break
             dirname = os.path.dirname(path)
-            if dirname not in self.dirs:
-                self.observer.schedule(self, dirname, recursive=False)
+            self._schedule_dir(dirname)
             self.dirs[dirname].add(path)
+            self._tracked_files.add(f"{path}.py")
 
         def _add_module_later(self, path: str) -> None:
             self.modules_to_add_later.append(path)
@@ -66,8 +92,9 @@ else:
             if not self.started:
                 self.started = True
                 self.observer.start()
+            # schedule directories again after deactivate
             for dirname in self.dirs:
-                self.observer.schedule(self, dirname, recursive=False)
+                self._schedule_dir(dirname)
             for module in self.modules_to_add_later:
                 self._add_module(module)
             self.modules_to_add_later.clear()
@@ -76,12 +103,37 @@ else:
         def deactivate(self) -> None:
             if not self.activated:
                 raise ValueError(f"{self!r} is not activated.")
-            self.observer.unschedule_all()
+            self._unschedule_all()
+            self._cancel_pending_changes()
             self.activated = False
 
         def on_any_event(self, event: FileSystemEvent) -> None:
-            dirpath = os.path.dirname(event.src_path)
-            if any(
-                event.src_path == f"{path}.py" for path in self.dirs[dirpath]
-            ):
-                self.on_change((event.src_path,))
+            if event.src_path in self._tracked_files:
+                self._schedule_change(event.src_path)
+
+        def _schedule_change(self, path: str) -> None:
+            with self._pending_lock:
+                if path not in self._pending:
+                    self._pending.append(path)
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                self._flush_timer = threading.Timer(
+                    CHANGE_DEBOUNCE_DELAY, self._flush
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        def _cancel_pending_changes(self) -> None:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                self._pending.clear()
+
+        def _flush(self) -> None:
+            with self._pending_lock:
+                files_modified = tuple(self._pending)
+                self._pending.clear()
+                self._flush_timer = None
+            if files_modified:
+                self.on_change(files_modified)
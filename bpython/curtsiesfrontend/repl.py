@@ -2055,14 +2055,11 @@ class BaseRepl(Repl):
         self.current_line = ""
 
     def initialize_interp(self) -> None:
-        self.coderunner.interp.locals["_repl"] = self
-        self.coderunner.interp.runsource(
-            "from bpython.curtsiesfrontend._internal import _Helper\n"
-        )
-        self.coderunner.interp.runsource("help = _Helper(_repl)\n")
-        self.coderunner.interp.runsource("del _Helper\n")
+        # importing _internal replaces pydoc.pager, so only do it once an
+        # interactive session needs help
+        from ._internal import _Helper
 
-        del self.coderunner.interp.locals["_repl"]
+        self.coderunner.interp.locals["help"] = _Helper(self)
 
     def getstdout(self) -> str:
         """
@@ -1,10 +1,20 @@
+import io
 import unittest
 
 from collections import namedtuple
-from bpython.curtsies import combined_events
+from unittest import mock
+from bpython.curtsies import (
+    combined_events,
+    BEGIN_SYNCHRONIZED_UPDATE,
+    END_SYNCHRONIZED_UPDATE,
+    FrameBufferedWindow,
+    FullCurtsiesRepl,
+)
+from bpython.curtsiesfrontend import events
 from bpython.test import FixLanguageTestCase as TestCase
 
 import curtsies.events
+from curtsies import fmtstr
 
 
 ScheduledEvent = namedtuple("ScheduledEvent", ["when", "event"])
@@ -84,6 +94,87 @@ class TestCurtsiesPasteDetection(TestCase):
         self.assertEqual(cb.send(None), "h")
         self.assertEqual(cb.send(None), None)
 
+    def test_event_after_keys_is_kept(self):
+        eg = EventGenerator(list("ab"))
+        # events can't be ordered against keys, so skip schedule_event
+        eg._events.append(ScheduledEvent(0, curtsies.events.SigIntEvent()))
+        cb = combined_events(eg, paste_threshold=3)
+        self.assertEqual(next(cb), "a")
+        self.assertEqual(next(cb), "b")
+        self.assertIsInstance(next(cb), curtsies.events.SigIntEvent)
+        self.assertEqual(next(cb), None)
+
+
+class TestProcessPendingEvents(TestCase):
+    def test_burst_is_painted_once(self):
+        repl = mock.Mock()
+        cb = combined_events(EventGenerator(list("ab")), paste_threshold=3)
+        FullCurtsiesRepl.process_pending_events(repl, next(cb), cb)
+        repl.process_event_and_paint.assert_called_once_with("a")
+        repl._apply_event.assert_called_once_with("b")
+        repl._render.assert_called_once_with()
+
+    def test_output_is_painted_before_resuming_code(self):
+        # each write from running code requests a refresh, which resumes
+        # the code; here the code blocks after the second write
+        refreshes = [events.RefreshRequestEvent() for _ in range(3)]
+        eg = EventGenerator()
+        eg._events.extend(ScheduledEvent(0, e) for e in refreshes)
+        cb = combined_events(eg, paste_threshold=3)
+        repl = mock.Mock()
+        repl.coderunner.code_is_waiting = True
+        FullCurtsiesRepl.process_pending_events(repl, next(cb), cb)
+        self.assertEqual(
+            repl.mock_calls,
+            [
+                mock.call.process_event_and_paint(refreshes[0]),
+                mock.call._apply_event(refreshes[1]),
+                mock.call._render(),
+                mock.call._apply_event(refreshes[2]),
+                mock.call._render(),
+            ],
+        )
+
+    def test_single_event_is_painted_immediately(self):
+        repl = mock.Mock()
+        cb = combined_events(EventGenerator(list("a")), paste_threshold=3)
+        FullCurtsiesRepl.process_pending_events(repl, next(cb), cb)
+        repl.process_event_and_paint.assert_called_once_with("a")
+        repl._apply_event.assert_not_called()
+        repl._render.assert_not_called()
+
+
+class TestFrameBufferedWindow(TestCase):
+    def setUp(self):
+        self.window = FrameBufferedWindow(
+            io.StringIO(), io.StringIO(), synchronized_updates=True
+        )
+        self.window.top_usable_row = 0
+        self.writes = []
+        self.window.out_stream = mock.Mock(
+            write=self.writes.append, flush=lambda: None
+        )
+
+    def test_frame_is_written_at_once(self):
+        self.window.render_to_terminal([fmtstr("a"), fmtstr("b")])
+        self.assertEqual(len(self.writes), 1)
+        self.assertTrue(self.writes[0].startswith(BEGIN_SYNCHRONIZED_UPDATE))
+        self.assertTrue(self.writes[0].endswith(END_SYNCHRONIZED_UPDATE))
+        self.assertIn("a", self.writes[0])
+        self.assertIn("b", self.writes[0])
+
+    def test_cursor_query_during_frame_is_not_held_back(self):
+        # as if a SIGWINCH handler queried the cursor in the middle of a frame
+        self.window.in_stream = io.StringIO("\x1b[3;4R")
+        self.window._frame = ["partial frame"]
+        self.assertEqual(self.window.get_cursor_position(), (2, 3))
+        self.assertEqual(self.writes, ["partial frame", "\x1b[6n"])
+        self.assertEqual(self.window._frame, [])
+
+    def test_writes_outside_frame_pass_through(self):
+        self.window.write("a")
+        self.assertEqual(self.writes, ["a"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,7 @@ from unittest import mock
 
 from bpython.curtsiesfrontend import repl as curtsiesrepl
 from bpython.curtsiesfrontend import interpreter
+from bpython.curtsiesfrontend import _internal
 from bpython.curtsiesfrontend import events as bpythonevents
 from bpython.curtsiesfrontend.repl import LineType
 from bpython import autocomplete
@@ -88,6 +89,14 @@ class TestCurtsiesRepl(TestCase):
         self.assertEqual(curtsiesrepl._last_word("a"), "a")
         self.assertEqual(curtsiesrepl._last_word("a b"), "b")
 
+    def test_initialize_interp(self):
+        with mock.patch("pydoc.pager"):
+            self.repl.initialize_interp()
+        interp_locals = self.repl.interp.locals
+        self.assertIsInstance(interp_locals["help"], _internal._Helper)
+        self.assertNotIn("_Helper", interp_locals)
+        self.assertNotIn("_repl", interp_locals)
+
     @unittest.skip("this is the behavior of bash - not currently implemented")
     def test_get_last_word_with_prev_line(self):
         self.repl.rl_history.entries = ["1", "2 3", "4 5 6"]
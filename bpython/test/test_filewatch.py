@@ -1,8 +1,10 @@
+import importlib.machinery
 import os
 import unittest
 
 try:
     import watchdog
+    from bpython.curtsiesfrontend import filewatch
     from bpython.curtsiesfrontend.filewatch import ModuleChangedEventHandler
 
     has_watchdog = True
@@ -28,6 +30,81 @@ class TestModuleChangeEventHandler(unittest.TestCase):
             self.module.dirs[os.path.abspath("something")],
         )
 
+    def test_add_module_strips_whole_suffix(self):
+        # extension module suffixes like .cpython-311-x86_64-linux-gnu.so
+        # contain several dots, so os.path.splitext would not strip them
+        for suffix in importlib.machinery.all_suffixes():
+            self.module._add_module(f"something/ext{suffix}")
+        self.assertEqual(
+            self.module.dirs[os.path.abspath("something")],
+            {os.path.abspath("something/ext")},
+        )
+
+    def test_events_are_batched(self):
+        on_change = mock.Mock()
+        self.module.on_change = on_change
+        self.module._add_module("something/test.py")
+        path = os.path.abspath("something/test.py")
+        with mock.patch.object(filewatch.threading, "Timer") as timer:
+            first_timer = timer.return_value = mock.Mock()
+            self.module.on_any_event(mock.Mock(src_path=path))
+            second_timer = timer.return_value = mock.Mock()
+            self.module.on_any_event(
+                mock.Mock(src_path=os.path.abspath("something/other.py"))
+            )
+            self.module.on_any_event(mock.Mock(src_path=path))
+
+        # untracked files don't arm the timer, others re-arm it
+        self.assertEqual(
+            timer.call_args_list,
+            [mock.call(filewatch.CHANGE_DEBOUNCE_DELAY, self.module._flush)]
+            * 2,
+        )
+        first_timer.start.assert_called_once_with()
+        first_timer.cancel.assert_called_once_with()
+        second_timer.start.assert_called_once_with()
+        second_timer.cancel.assert_not_called()
+        on_change.assert_not_called()
+
+        # the timer fires
+        timer.call_args.args[1]()
+        on_change.assert_called_once_with((path,))
+
+    def test_reset_cancels_pending_changes(self):
+        on_change = mock.Mock()
+        self.module.on_change = on_change
+        self.module._add_module("something/test.py")
+        path = os.path.abspath("something/test.py")
+        with mock.patch.object(filewatch.threading, "Timer") as timer:
+            self.module.on_any_event(mock.Mock(src_path=path))
+        self.module.reset()
+        timer.return_value.cancel.assert_called_once_with()
+        self.module._flush()
+        on_change.assert_not_called()
+
+    def test_directories_are_scheduled_once(self):
+        self.module._add_module("something/test.py")
+        self.module._add_module("something/other.py")
+        self.module.activate()
+        self.assertEqual(self.module.observer.schedule.call_count, 1)
+
+        self.module.deactivate()
+        self.module.activate()
+        self.assertEqual(self.module.observer.schedule.call_count, 2)
+
+    def test_initial_paths_are_added_on_activate(self):
+        module = ModuleChangedEventHandler(
+            ["something/test.py", "something/test.py"], 1
+        )
+        module.observer = mock.Mock()
+        self.assertFalse(module.dirs)
+        module.activate()
+        self.assertEqual(
+            module.dirs[os.path.abspath("something")],
+            {os.path.abspath("something/test")},
+        )
+        module.observer.schedule.assert_called_once()
+
     def test_activate_throws_error_when_already_activated(self):
         self.module.activated = True
         with self.assertRaises(ValueError):
@@ -7,7 +7,10 @@ from code import compile_command as compiler
 from functools import partial
 
 from bpython.curtsiesfrontend.interpreter import code_finished_will_parse
-from bpython.curtsiesfrontend.preprocess import preprocess
+from bpython.curtsiesfrontend.preprocess import (
+    leading_tabs_to_spaces,
+    preprocess,
+)
 from bpython.test.fodder import original, processed
 
 
@@ -104,3 +107,9 @@ class TestPreprocessing(unittest.TestCase):
 
     def test_tabs(self):
         self.assertIndented(original.tabs)
+
+    def test_only_leading_tabs_replaced(self):
+        self.assertEqual(
+            leading_tabs_to_spaces("\t\ta\tb\n\t c\n\n d\t"),
+            "        a\tb\n     c\n\n d\t",
+        )